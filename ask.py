@@ -1,10 +1,14 @@
-from langchain_community.llms import Ollama
-from langchain_community.vectorstores import Chroma
-from langchain_community.embeddings import OllamaEmbeddings
-from colorama import init, Fore, Style
-import time
+import argparse
+import json
+import os
+import socket
+import stat
 import sys
+import time
+
+from colorama import init, Fore, Style
 from router import classify_query
+from scheduler import GenerationScheduler, format_stats
 
 init(autoreset=True)
 
@@ -21,70 +25,59 @@ Rules:
 - Keep answers concise and professional
 """
 
-def main():
-    print(f"{Fore.CYAN}{'='*60}")
-    print(f"{Fore.CYAN}WEMA BANK AI ASSISTANT")
-    print(f"{Fore.CYAN}{'='*60}\n")
+# Unix socket used by engine.py (a long-lived process that keeps the model
+# and knowledge base loaded between ask.py runs). It lives in a per-user
+# directory, never a shared one like /tmp, so other users cannot stand in
+# for the engine.
+ENGINE_SOCKET = os.environ.get(
+    "WEMA_ENGINE_SOCKET",
+    os.path.join(os.environ.get("XDG_RUNTIME_DIR") or os.path.expanduser("~/.wema"), "wema_engine.sock")
+)
 
-    # Initialize
-    print(f"{Fore.YELLOW}Loading AI model and knowledge base...\n")
+# (stage, seconds) pairs recorded while starting up, shown with --timings
+STARTUP_TIMINGS = []
 
-    try:
-        embeddings = OllamaEmbeddings(model="nomic-embed-text")
-        db = Chroma(
-            persist_directory="bank_db",
-            embedding_function=embeddings,
-            collection_name="wema_knowledge"
-        )
-        llm = Ollama(model="mistral")
-        retriever = db.as_retriever(search_kwargs={"k": 5})
-    except Exception as e:
-        print(f"{Fore.RED}Error initializing system: {e}")
-        print(f"{Fore.YELLOW}Make sure you have run 'python ingest.py' and Ollama is running.")
-        sys.exit(1)
-
-    print(f"{Fore.GREEN}✓ System ready!\n")
-    print(f"{Fore.YELLOW}Type your question (or 'quit' to exit)\n")
-    print(f"{Fore.CYAN}{'='*60}\n")
 
-    def detect_scope(query: str):
-        q = query.lower()
-        if any(w in q for w in ["policy", "procedure", "guideline"]):
-            return {"type": "policy"}
-        if any(w in q for w in ["regulation", "cbn", "compliance"]):
-            return {"type": "regulation"}
-        if any(w in q for w in ["memo", "circular", "announcement"]):
-            return {"type": "memo"}
-        return None
+def load_system():
+    """Import the LangChain stack and open the knowledge base.
 
-    def ask(question):
-        # Routing: decide query type
-        query_type = classify_query(question)
+    The heavy imports live here instead of at the top of the file, so talking
+    to a running engine (or answering DATA/ACTION questions) never pays for them.
+    """
+    start = time.perf_counter()
+    from langchain_community.llms import Ollama
+    from langchain_community.vectorstores import Chroma
+    from langchain_community.embeddings import OllamaEmbeddings
+    STARTUP_TIMINGS.append(("langchain imports", time.perf_counter() - start))
 
-        if query_type == "DATA":
-            print(f"\n{Fore.MAGENTA}🔒 This question requires access to live banking data.")
-            print(f"{Fore.MAGENTA}Connect the assistant to the Core Banking/EDW system to enable this feature.\n")
-            return
+    start = time.perf_counter()
+    embeddings = OllamaEmbeddings(model="nomic-embed-text")
+    db = Chroma(
+        persist_directory="bank_db",
+        embedding_function=embeddings,
+        collection_name="wema_knowledge"
+    )
+    llm = Ollama(model="mistral")
+    STARTUP_TIMINGS.append(("knowledge base + model", time.perf_counter() - start))
+    return llm, db
 
-        if query_type == "ACTION":
-            print(f"\n{Fore.MAGENTA}🛠 This is an action request (messaging/automation).")
-            print(f"{Fore.MAGENTA}Action tools are not enabled yet.\n")
-            return
 
-        # Knowledge retrieval only
-        filter_meta = detect_scope(question)
+def detect_scope(query: str):
+    q = query.lower()
+    if any(w in q for w in ["policy", "procedure", "guideline"]):
+        return {"type": "policy"}
+    if any(w in q for w in ["regulation", "cbn", "compliance"]):
+        return {"type": "regulation"}
+    if any(w in q for w in ["memo", "circular", "announcement"]):
+        return {"type": "memo"}
+    return None
 
-        # Retrieve relevant documents with dynamic metadata filter
-        if filter_meta:
-            docs = db.similarity_search(question, k=4, filter=filter_meta)
-        else:
-            docs = db.similarity_search(question, k=4)
 
-        # Build strict, grounded context
-        context = "\n\n".join([d.page_content for d in docs])
+def build_prompt(question, docs):
+    # Build strict, grounded context
+    context = "\n\n".join([d.page_content for d in docs])
 
-        # Grounded system prompt
-        prompt = f"""
+    return f"""
 {SYSTEM_PROMPT}
 
 Context:
@@ -95,32 +88,202 @@ Question: {question}
 Answer:
 """
 
-        # Get response
-        start_time = time.time()
+
+def answer(question, scheduler, db):
+    """Answer a KNOWLEDGE question against the knowledge base.
+
+    Returns (response, elapsed) where elapsed covers queueing + generation.
+    """
+    # Knowledge retrieval only
+    filter_meta = detect_scope(question)
+
+    # Retrieve relevant documents with dynamic metadata filter
+    if filter_meta:
+        docs = db.similarity_search(question, k=4, filter=filter_meta)
+    else:
+        docs = db.similarity_search(question, k=4)
+
+    prompt = build_prompt(question, docs)
+
+    start_time = time.time()
+    response, _ = scheduler.generate(prompt, question)
+    return response, time.time() - start_time
+
+
+def trusted_socket(path):
+    """True if path is a Unix socket owned by the current user.
+
+    Questions and answers carry internal bank information, so never talk to a
+    socket that another local user could have created.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+def engine_available(path=ENGINE_SOCKET):
+    """True if an engine accepts connections on path (not just a stale socket file)."""
+    if not trusted_socket(path):
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
         try:
-            response = llm.invoke(prompt)
-            elapsed = time.time() - start_time
-            
-            print(f"\n{Fore.GREEN}{response}")
-            print(f"\n{Fore.CYAN}[Response time: {elapsed:.2f}s]")
-            print(f"{Fore.CYAN}{'='*60}\n")
+            sock.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+def query_engine(question, path=ENGINE_SOCKET):
+    """Send a question to a running engine."""
+    return engine_request({"question": question}, path)
+
+
+def engine_request(payload, path=ENGINE_SOCKET):
+    """Send one JSON request to the engine.
+
+    Returns the engine's reply dict, or None if no engine is listening.
+    """
+    if not trusted_socket(path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(path)
+            sock.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+            with sock.makefile("r", encoding="utf-8") as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+    if not line:
+        return None
+    try:
+        reply = json.loads(line)
+    except ValueError:
+        reply = None
+    if not isinstance(reply, dict):
+        return {"error": "engine sent an invalid reply"}
+    return reply
+
+
+def print_routed(query_type):
+    if query_type == "DATA":
+        print(f"\n{Fore.MAGENTA}🔒 This question requires access to live banking data.")
+        print(f"{Fore.MAGENTA}Connect the assistant to the Core Banking/EDW system to enable this feature.\n")
+    elif query_type == "ACTION":
+        print(f"\n{Fore.MAGENTA}🛠 This is an action request (messaging/automation).")
+        print(f"{Fore.MAGENTA}Action tools are not enabled yet.\n")
+
+
+def print_response(response, elapsed):
+    print(f"\n{Fore.GREEN}{response}")
+    print(f"\n{Fore.CYAN}[Response time: {elapsed:.2f}s]")
+    print(f"{Fore.CYAN}{'='*60}\n")
+
+
+def print_timings():
+    print(f"{Fore.CYAN}Startup timings:")
+    for stage, seconds in STARTUP_TIMINGS:
+        print(f"{Fore.CYAN}   - {stage}: {seconds:.3f}s")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Wema Bank AI Assistant (command line)")
+    parser.add_argument("question", nargs="*", help="ask a single question and exit")
+    parser.add_argument("--no-engine", action="store_true",
+                        help="ignore a running engine and load the model in this process")
+    parser.add_argument("--timings", action="store_true", help="print startup timings")
+    parser.add_argument("--stats", action="store_true",
+                        help="print the running engine's per-intent queue times and exit")
+    args = parser.parse_args()
+
+    if args.stats:
+        reply = engine_request({"stats": True})
+        if reply is None:
+            print(f"{Fore.RED}No engine is running at {ENGINE_SOCKET}")
+            sys.exit(1)
+        if "error" in reply:
+            print(f"{Fore.RED}Error getting stats: {reply['error']}")
+            sys.exit(1)
+        print(format_stats(reply["stats"]))
+        return
+
+    use_engine = not args.no_engine
+    system = {}
+
+    def ensure_loaded():
+        if system:
+            return
+        print(f"{Fore.YELLOW}Loading AI model and knowledge base...\n")
+        try:
+            llm, system["db"] = load_system()
+        except Exception as e:
+            print(f"{Fore.RED}Error initializing system: {e}")
+            print(f"{Fore.YELLOW}Make sure you have run 'python ingest.py' and Ollama is running.")
+            sys.exit(1)
+        system["scheduler"] = GenerationScheduler(llm)
+        if args.timings:
+            print_timings()
+
+    def ask(question):
+        # Routing: decide query type
+        query_type = classify_query(question)
+
+        if query_type != "KNOWLEDGE":
+            print_routed(query_type)
+            return
+
+        if use_engine:
+            reply = query_engine(question)
+            if reply is not None:
+                if "error" in reply:
+                    print(f"{Fore.RED}Error getting response: {reply['error']}")
+                else:
+                    print_response(reply["response"], reply["elapsed"])
+                return
+
+        ensure_loaded()
+        try:
+            response, elapsed = answer(question, system["scheduler"], system["db"])
+            print_response(response, elapsed)
         except Exception as e:
             print(f"{Fore.RED}Error getting response: {e}")
 
+    # One-shot mode: `python ask.py "question"`
+    if args.question:
+        ask(" ".join(args.question))
+        return
+
+    print(f"{Fore.CYAN}{'='*60}")
+    print(f"{Fore.CYAN}WEMA BANK AI ASSISTANT")
+    print(f"{Fore.CYAN}{'='*60}\n")
+
+    # Initialize (skipped when a background engine is already serving)
+    if use_engine and engine_available():
+        print(f"{Fore.GREEN}✓ Connected to engine at {ENGINE_SOCKET}\n")
+    else:
+        use_engine = False
+        ensure_loaded()
+        print(f"{Fore.GREEN}✓ System ready!\n")
+
+    print(f"{Fore.YELLOW}Type your question (or 'quit' to exit)\n")
+    print(f"{Fore.CYAN}{'='*60}\n")
+
     # Interactive loop
     while True:
         try:
             question = input(f"{Fore.YELLOW}💬 Ask: {Style.RESET_ALL}")
-            
+
             if question.lower() in ['quit', 'exit', 'q']:
                 print(f"\n{Fore.GREEN}Thank you for using Wema Bank AI Assistant!\n")
                 break
-                
+
             if not question.strip():
                 continue
-                
+
             ask(question)
-            
+
         except KeyboardInterrupt:
             print(f"\n\n{Fore.GREEN}Thank you for using Wema Bank AI Assistant!\n")
             break
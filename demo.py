@@ -1,6 +1,3 @@
-from langchain_community.llms import Ollama
-from langchain_community.vectorstores import Chroma
-from langchain_community.embeddings import OllamaEmbeddings
 from colorama import init, Fore, Style
 import time
 import sys
@@ -79,6 +76,11 @@ def main():
     print(f"{Fore.YELLOW}🔧 Initializing system...\n")
 
     try:
+        # Imported here so the banner shows before the slow LangChain imports
+        from langchain_community.llms import Ollama
+        from langchain_community.vectorstores import Chroma
+        from langchain_community.embeddings import OllamaEmbeddings
+
         embeddings = OllamaEmbeddings(model="nomic-embed-text")
         db = Chroma(
             persist_directory="bank_db",
@@ -86,7 +88,6 @@ def main():
             collection_name="wema_knowledge"
         )
         llm = Ollama(model="mistral")
-        retriever = db.as_retriever(search_kwargs={"k": 5})
     except Exception as e:
         print(f"{Fore.RED}Error initializing system: {e}")
         sys.exit(1)
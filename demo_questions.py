@@ -0,0 +1,36 @@
+"""Demo questions for the web UI, shared with loadtest.py."""
+
+# Demo questions organized by category
+DEMO_CATEGORIES = {
+    "📋 Policy Questions": [
+        "What collateral is required for SME overdraft?",
+        "What is the turnaround time for loan approval?",
+        "What documents are needed for SME loan application?",
+        "What are the interest rates for term loans?",
+        "How do I reactivate a dormant account?"
+    ],
+    "👤 Customer Service": [
+        "What is John Bello's complaint about?",
+        "How many customer complaints are pending?",
+        "What should we do about Fatima Ibrahim's ATM card issue?",
+        "Draft a response to Chidi Okafor about his loan application delay"
+    ],
+    "💳 Transactions": [
+        "Show me account 0123456789's transaction summary for January",
+        "What was the highest expense in January for account 0123456789?",
+        "How much interest was earned in January?",
+        "Why did transaction TXN20260205005 fail?"
+    ],
+    "⚖️ Compliance & Regulations": [
+        "What are the CBN requirements for foreign exchange transactions?",
+        "What is the maximum Personal Travel Allowance?",
+        "What are the KYC requirements for account opening?",
+        "What transactions must be reported to NFIU?"
+    ],
+    "🏢 Operations": [
+        "What is the branch manager's approval limit for overdrafts?",
+        "What should I do during system downtime?",
+        "What are the month-end procedures?",
+        "When is the internal audit scheduled?"
+    ]
+}
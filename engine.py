@@ -0,0 +1,115 @@
+"""Background engine for ask.py.
+
+Loads the model and knowledge base once and answers questions over a Unix
+socket, so repeated `python ask.py "question"` runs skip the LangChain
+imports and Chroma start-up entirely.
+
+Protocol: one JSON line per connection, {"question": "..."} in and
+{"response": "...", "elapsed": 1.23} (or {"error": "..."}) out. Sending
+{"stats": true} returns the scheduler's per-intent queue times instead.
+
+Concurrent clients share the model through a GenerationScheduler, so quick
+lookups are answered ahead of long drafting jobs.
+"""
+import argparse
+import json
+import os
+import socketserver
+import stat
+import sys
+
+from colorama import init, Fore
+
+from ask import ENGINE_SOCKET, STARTUP_TIMINGS, answer, engine_available, load_system
+from scheduler import DEFAULT_WORKERS, GenerationScheduler, format_stats
+
+init(autoreset=True)
+
+
+class EngineHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+            if request.get("stats"):
+                reply = {"stats": self.server.scheduler.stats()}
+            else:
+                response, elapsed = answer(request["question"], self.server.scheduler, self.server.db)
+                reply = {"response": response, "elapsed": elapsed}
+        except Exception as e:
+            reply = {"error": str(e)}
+        self.wfile.write((json.dumps(reply) + "\n").encode("utf-8"))
+
+
+class EngineServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, scheduler, db):
+        self.scheduler = scheduler
+        self.db = db
+        super().__init__(path, EngineHandler)
+
+
+def remove_stale_socket(path):
+    """Delete a socket file left behind by an engine that is no longer running."""
+    if engine_available(path):
+        print(f"{Fore.RED}An engine is already listening on {path}")
+        sys.exit(1)
+    if not os.path.lexists(path):
+        return
+    if not stat.S_ISSOCK(os.lstat(path).st_mode):
+        print(f"{Fore.RED}{path} exists and is not a socket; refusing to replace it")
+        sys.exit(1)
+    try:
+        os.unlink(path)
+    except OSError as e:
+        print(f"{Fore.RED}Cannot remove stale socket {path}: {e}")
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Wema Bank AI Assistant background engine")
+    parser.add_argument("--socket", default=ENGINE_SOCKET, help="Unix socket path to listen on")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="concurrent generations (match OLLAMA_NUM_PARALLEL)")
+    args = parser.parse_args()
+
+    # Owner-only directory for the socket (see ask.ENGINE_SOCKET)
+    os.makedirs(os.path.dirname(os.path.abspath(args.socket)), mode=0o700, exist_ok=True)
+    remove_stale_socket(args.socket)
+
+    print(f"{Fore.YELLOW}Loading AI model and knowledge base...\n")
+    try:
+        llm, db = load_system()
+    except Exception as e:
+        print(f"{Fore.RED}Error initializing system: {e}")
+        print(f"{Fore.YELLOW}Make sure you have run 'python ingest.py' and Ollama is running.")
+        sys.exit(1)
+    for stage, seconds in STARTUP_TIMINGS:
+        print(f"{Fore.CYAN}   - {stage}: {seconds:.3f}s")
+
+    # Answers come from internal bank documents: keep the socket owner-only
+    old_umask = os.umask(0o177)
+    try:
+        server = EngineServer(args.socket, GenerationScheduler(llm, workers=args.workers), db)
+    finally:
+        os.umask(old_umask)
+
+    print(f"\n{Fore.GREEN}✓ Engine listening on {args.socket} (Ctrl+C to stop)\n")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.scheduler.shutdown()
+        os.unlink(args.socket)
+        print(f"\n{Fore.CYAN}Queue time by intent:")
+        print(format_stats(server.scheduler.stats()))
+        print(f"\n{Fore.GREEN}Engine stopped.\n")
+
+
+if __name__ == "__main__":
+    main()
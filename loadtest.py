@@ -0,0 +1,228 @@
+"""Concurrent-user load generator for the web UI (ui.py).
+
+Each virtual user is a thread with its own Gradio client that repeatedly
+picks a question from DEMO_CATEGORIES, calls the /ask endpoint, then waits
+a random think time. Users are ramped in steps (e.g. 1,2,4,8,16) and every
+step reports throughput, latency percentiles and error rate. The saturation
+point is the last step whose throughput still grew meaningfully over the
+previous one (or the last step before errors crossed --max-error-rate).
+
+Run against a live server:
+    python ui.py &
+    python loadtest.py --url http://localhost:7860/
+
+Or let the tool start ui.py in-process with a stub LLM that sleeps instead
+of generating, which isolates Gradio + retrieval from model speed:
+    python loadtest.py --stub-delay 1.5
+"""
+import argparse
+import csv
+import random
+import sys
+import threading
+import time
+
+from colorama import init, Fore
+from gradio_client import Client
+
+from demo_questions import DEMO_CATEGORIES
+from metrics import percentile
+from scheduler import GenerationScheduler, format_stats
+
+init(autoreset=True)
+
+# A step is "still scaling" if throughput grew by at least this factor
+SCALING_FACTOR = 1.1
+
+
+class StubLLM:
+    """Stands in for the real model: waits a fixed time, returns canned text."""
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    def stream(self, prompt, **kwargs):
+        words = "Stub answer generated for load testing.".split()
+        for word in words:
+            time.sleep(self.delay / len(words))
+            yield word + " "
+
+
+def parse_mix(value):
+    """Turn 'policy=3,operations=1' into {category: weight} over DEMO_CATEGORIES.
+
+    Keys match category names case-insensitively by substring; categories not
+    mentioned get weight 0. An empty mix weights every category equally.
+    """
+    if not value:
+        return {category: 1 for category in DEMO_CATEGORIES}
+    weights = {category: 0 for category in DEMO_CATEGORIES}
+    for part in value.split(","):
+        key, _, weight = part.partition("=")
+        matches = [c for c in weights if key.strip().lower() in c.lower()]
+        if not matches:
+            raise argparse.ArgumentTypeError(f"no demo category matches '{key.strip()}'")
+        for category in matches:
+            weights[category] = float(weight or 1)
+    return weights
+
+
+def user_steps(value):
+    steps = [int(u) for u in value.split(",") if u.strip()]
+    if not steps or min(steps) < 1:
+        raise argparse.ArgumentTypeError("need at least one positive user count, e.g. '1,2,4'")
+    return steps
+
+
+def last_answer(history):
+    """Bot text of the final chat turn (tuple or messages format)."""
+    if not history:
+        return ""
+    last = history[-1]
+    if isinstance(last, dict):
+        return str(last.get("content", ""))
+    return str(last[1])
+
+
+def virtual_user(url, mix, think_time, stop_at, results, lock):
+    client = Client(url, verbose=False)
+    categories = list(mix)
+    weights = [mix[c] for c in categories]
+
+    while time.time() < stop_at:
+        category = random.choices(categories, weights=weights)[0]
+        question = random.choice(DEMO_CATEGORIES[category])
+
+        start = time.perf_counter()
+        try:
+            history, _ = client.predict(question, [], api_name="/ask")
+            text = last_answer(history)
+            ok = not (text.startswith("Error:") or text.startswith("System not initialized"))
+        except Exception:
+            ok = False
+        latency = time.perf_counter() - start
+
+        with lock:
+            results.append((latency, ok))
+
+        if think_time > 0:
+            # Never sleep past the end of the step, or the measured window stretches
+            time.sleep(min(random.expovariate(1 / think_time), max(0, stop_at - time.time())))
+
+
+def run_step(url, users, duration, mix, think_time):
+    results = []
+    lock = threading.Lock()
+    stop_at = time.time() + duration
+    threads = [
+        threading.Thread(target=virtual_user, args=(url, mix, think_time, stop_at, results, lock), daemon=True)
+        for _ in range(users)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # Requests in flight at stop_at still finish, so measure the real window
+    elapsed = time.perf_counter() - start
+
+    latencies = [lat for lat, ok in results if ok]
+    errors = sum(1 for _, ok in results if not ok)
+    return {
+        "users": users,
+        "requests": len(results),
+        "errors": errors,
+        "error_rate": round(errors / len(results), 3) if results else 0.0,
+        "throughput_rps": round(len(latencies) / elapsed, 3),
+        "p50_s": round(percentile(latencies, 50), 2),
+        "p95_s": round(percentile(latencies, 95), 2),
+        "p99_s": round(percentile(latencies, 99), 2),
+    }
+
+
+def find_saturation(steps, max_error_rate):
+    """User count after which adding users stopped paying off.
+
+    None when the very first step already exceeds max_error_rate.
+    """
+    if steps[0]["error_rate"] > max_error_rate:
+        return None
+    for prev, step in zip(steps, steps[1:]):
+        if step["error_rate"] > max_error_rate:
+            return prev["users"]
+        if step["throughput_rps"] < prev["throughput_rps"] * SCALING_FACTOR:
+            return prev["users"]
+    return steps[-1]["users"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the Wema Bank AI web UI")
+    parser.add_argument("--url", default="http://localhost:7860/")
+    parser.add_argument("--users", type=user_steps, default=user_steps("1,2,4,8,16"),
+                        help="comma-separated virtual user steps")
+    parser.add_argument("--duration", type=float, default=60, help="seconds per step")
+    parser.add_argument("--think-time", type=float, default=5, help="mean seconds between a user's questions")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(""),
+                        help="category weights, e.g. 'policy=3,compliance=2,operations=1'")
+    parser.add_argument("--max-error-rate", type=float, default=0.05)
+    parser.add_argument("--stub-delay", type=float, default=None,
+                        help="serve ui.py in-process with a stub LLM taking this many seconds")
+    parser.add_argument("--port", type=int, default=7861, help="port for the in-process stub server")
+    parser.add_argument("--output", default=None, help="also write the step table to this CSV file")
+    args = parser.parse_args()
+
+    url = args.url
+    if args.stub_delay is not None:
+        # Only the in-process server needs the UI (Chroma, model, Gradio app)
+        import ui
+        if ui.db is None:
+            print(f"{Fore.RED}Knowledge base not available. Please run 'python ingest.py' first.")
+            sys.exit(1)
+        if ui.scheduler:
+            ui.scheduler.shutdown()
+        ui.llm = StubLLM(args.stub_delay)
+        ui.scheduler = GenerationScheduler(ui.llm)
+        ui.demo.launch(server_name="127.0.0.1", server_port=args.port, prevent_thread_lock=True, quiet=True)
+        url = f"http://127.0.0.1:{args.port}/"
+
+    print(f"{Fore.CYAN}{'='*70}")
+    print(f"{Fore.CYAN}WEMA BANK AI ASSISTANT - WEB UI LOAD TEST")
+    print(f"{Fore.CYAN}{'='*70}\n")
+    llm_label = f"stub ({args.stub_delay}s)" if args.stub_delay is not None else "real"
+    print(f"{Fore.YELLOW}Target: {url} | LLM: {llm_label} | {args.duration:.0f}s per step | think time ~{args.think_time}s\n")
+
+    steps = []
+    for users in args.users:
+        print(f"{Fore.YELLOW}Running {users} virtual user(s)...")
+        step = run_step(url, users, args.duration, args.mix, args.think_time)
+        steps.append(step)
+        print(f"{Fore.WHITE}   {step['requests']} requests, {step['throughput_rps']:.2f} req/s, "
+              f"p95 {step['p95_s']:.2f}s, errors {step['error_rate']:.1%}")
+
+    print(f"\n{Fore.CYAN}{'users':>6} {'reqs':>6} {'req/s':>7} {'p50':>7} {'p95':>7} {'p99':>7} {'errors':>7}")
+    for s in steps:
+        print(f"{s['users']:>6} {s['requests']:>6} {s['throughput_rps']:>7.2f} {s['p50_s']:>6.2f}s "
+              f"{s['p95_s']:>6.2f}s {s['p99_s']:>6.2f}s {s['error_rate']:>7.1%}")
+
+    saturation = find_saturation(steps, args.max_error_rate)
+    if saturation is None:
+        print(f"\n{Fore.RED}Saturation point: none (errors at the first step)\n")
+    else:
+        print(f"\n{Fore.GREEN}Saturation point: ~{saturation} concurrent user(s)\n")
+
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(steps[0]))
+            writer.writeheader()
+            writer.writerows(steps)
+        print(f"{Fore.GREEN}✓ Report written to {args.output}\n")
+
+    if args.stub_delay is not None:
+        # Server runs in this process, so its scheduler's queue times are visible
+        print(f"{Fore.CYAN}Queue time by intent:")
+        print(format_stats(ui.scheduler.stats()))
+        ui.demo.close()
+
+
+if __name__ == "__main__":
+    main()
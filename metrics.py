@@ -0,0 +1,11 @@
+"""Latency summary helpers shared by loadtest.py and scheduler.py."""
+import math
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an unsorted list (0.0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
@@ -18,6 +18,12 @@ ACTION_KEYWORDS = [
     "birthday wish", "email customer", "notify"
 ]
 
+# Long-form generation requests (scheduled behind quick lookups)
+DRAFT_KEYWORDS = [
+    "draft", "write a response", "write a reply", "write a letter",
+    "prepare a response", "respond to"
+]
+
 
 def classify_query(query: str) -> str:
     q = query.lower()
@@ -33,3 +39,21 @@ def classify_query(query: str) -> str:
 
     # default safe behavior
     return "KNOWLEDGE"
+
+
+def classify_intent(query: str) -> str:
+    """Intent used for generation scheduling.
+
+    Like classify_query, but KNOWLEDGE is split into quick LOOKUPs and
+    long-form DRAFTs, and drafting wins over the DATA/ACTION keywords.
+    """
+    q = query.lower()
+
+    # Whole words only: "draft" must not match "overdraft"
+    if any(re.search(rf"\b{re.escape(k)}\b", q) for k in DRAFT_KEYWORDS):
+        return "DRAFT"
+
+    query_type = classify_query(query)
+    if query_type == "KNOWLEDGE":
+        return "LOOKUP"
+    return query_type
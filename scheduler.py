@@ -0,0 +1,202 @@
+"""Intent-aware generation scheduler.
+
+All LLM calls go through a GenerationScheduler: requests wait in a priority
+queue ordered by estimated cost (shortest job first), so a quick policy
+lookup is not stuck behind a long drafting job. Cost comes from the router
+intent (expected answer length) plus the prompt size.
+
+Aging keeps expensive jobs from starving. A job's priority is
+cost - AGING_RATE * seconds_waited; because every queued job ages at the
+same rate, that ordering equals sorting by cost + AGING_RATE * enqueue_time,
+which never changes and so fits a plain heap.
+
+Each intent also has a budget: max_tokens caps the answer length (passed to
+Ollama as the num_predict option) and timeout bounds queue + generation
+time. Generations are streamed so the deadline is checked between tokens; a
+job past its deadline is abandoned and closing the stream stops Ollama.
+"""
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+
+from metrics import percentile
+from router import classify_intent
+from tokens import estimate_tokens
+
+# Per-intent generation budgets. expected_tokens feeds the cost estimate;
+# max_tokens and timeout (seconds) are hard limits. max_tokens only lowers a
+# num_predict already configured on the LLM (see generation_options).
+BUDGETS = {
+    "LOOKUP": {"expected_tokens": 80, "max_tokens": 256, "timeout": 60},
+    "DRAFT": {"expected_tokens": 400, "max_tokens": 768, "timeout": 180},
+    "DATA": {"expected_tokens": 150, "max_tokens": 384, "timeout": 90},
+    "ACTION": {"expected_tokens": 150, "max_tokens": 384, "timeout": 90},
+}
+
+# Generating a token costs far more than reading one in the prompt
+OUTPUT_TOKEN_WEIGHT = 10
+
+# Cost units a queued job gains per second of waiting
+AGING_RATE = 50
+
+# Ollama serves one generation at a time unless OLLAMA_NUM_PARALLEL is raised
+DEFAULT_WORKERS = 1
+
+
+# Ollama options that LangChain's Ollama wrappers expose as model fields
+OLLAMA_OPTION_FIELDS = (
+    "mirostat", "mirostat_eta", "mirostat_tau", "num_ctx", "num_gpu", "num_thread",
+    "num_predict", "repeat_last_n", "repeat_penalty", "temperature", "stop",
+    "tfs_z", "top_k", "top_p", "seed",
+)
+
+
+def generation_options(llm, max_tokens):
+    """The llm's configured Ollama options with num_predict capped at max_tokens.
+
+    Both Ollama wrappers treat an explicit options= as the whole options dict,
+    so settings like temperature or num_ctx must be carried over here.
+    """
+    options = {}
+    for field in OLLAMA_OPTION_FIELDS:
+        value = getattr(llm, field, None)
+        if value is not None:
+            options[field] = value
+    options["num_predict"] = min(options.get("num_predict", max_tokens), max_tokens)
+    return options
+
+
+def estimate_cost(prompt, intent):
+    return estimate_tokens(prompt) + OUTPUT_TOKEN_WEIGHT * BUDGETS[intent]["expected_tokens"]
+
+
+class GenerationScheduler:
+    def __init__(self, llm, workers=DEFAULT_WORKERS, aging_rate=AGING_RATE):
+        self.llm = llm
+        self.aging_rate = aging_rate
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._waits = {intent: [] for intent in BUDGETS}
+        self._dropped = {intent: 0 for intent in BUDGETS}
+        self._timed_out = {intent: 0 for intent in BUDGETS}
+
+        for _ in range(workers):
+            threading.Thread(target=self._worker, daemon=True).start()
+
+    def submit(self, prompt, intent):
+        """Queue a prompt; the Future resolves to (response, queued_seconds)."""
+        future = Future()
+        enqueued = time.monotonic()
+        key = estimate_cost(prompt, intent) + self.aging_rate * enqueued
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("scheduler is shut down")
+            heapq.heappush(self._heap, (key, next(self._seq), prompt, intent, enqueued, future))
+            self._cond.notify()
+        return future
+
+    def generate(self, prompt, question):
+        """Schedule a prompt for question and wait within its intent's timeout.
+
+        Returns (response, queued_seconds); raises TimeoutError when the budget
+        runs out. A job still waiting in the queue is then dropped; a running
+        one is stopped by its worker at the next token.
+        """
+        intent = classify_intent(question)
+        future = self.submit(prompt, intent)
+        timeout = BUDGETS[intent]["timeout"]
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeout:
+            future.cancel()
+            raise TimeoutError(f"{intent} request exceeded its {timeout}s budget") from None
+
+    def stats(self):
+        """Queue time per intent: {intent: {count, dropped, timed_out, mean_s, p95_s, max_s}}.
+
+        count is jobs that started generating, dropped is jobs whose deadline
+        passed while queued and timed_out is jobs stopped mid-generation.
+        """
+        with self._cond:
+            waits = {intent: sorted(w) for intent, w in self._waits.items()}
+            dropped = dict(self._dropped)
+            timed_out = dict(self._timed_out)
+        report = {}
+        for intent, w in waits.items():
+            if not w and not dropped[intent]:
+                continue
+            report[intent] = {
+                "count": len(w),
+                "dropped": dropped[intent],
+                "timed_out": timed_out[intent],
+                "mean_s": round(sum(w) / len(w), 3) if w else 0.0,
+                "p95_s": round(percentile(w, 95), 3),
+                "max_s": round(w[-1], 3) if w else 0.0,
+            }
+        return report
+
+    def shutdown(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._heap and not self._closed:
+                    self._cond.wait()
+                if not self._heap:
+                    return
+                _, _, prompt, intent, enqueued, future = heapq.heappop(self._heap)
+
+            budget = BUDGETS[intent]
+            deadline = enqueued + budget["timeout"]
+            queued = time.monotonic() - enqueued
+            if not future.set_running_or_notify_cancel():
+                # Caller's timeout expired while the job was still queued
+                with self._cond:
+                    self._dropped[intent] += 1
+                continue
+            if time.monotonic() > deadline:
+                with self._cond:
+                    self._dropped[intent] += 1
+                future.set_exception(TimeoutError(f"{intent} request exceeded its {budget['timeout']}s budget"))
+                continue
+            with self._cond:
+                self._waits[intent].append(queued)
+
+            stream = None
+            chunks = []
+            try:
+                stream = self.llm.stream(prompt, options=generation_options(self.llm, budget["max_tokens"]))
+                for chunk in stream:
+                    chunks.append(chunk)
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"{intent} request exceeded its {budget['timeout']}s budget")
+                future.set_result(("".join(chunks), queued))
+            except TimeoutError as e:
+                with self._cond:
+                    self._timed_out[intent] += 1
+                future.set_exception(e)
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                # Closing the stream drops the HTTP connection, which stops Ollama
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
+
+
+def format_stats(stats):
+    """Plain-text table of GenerationScheduler.stats()."""
+    lines = [f"{'intent':<8} {'count':>6} {'dropped':>8} {'timed out':>10} {'mean':>8} {'p95':>8} {'max':>8}"]
+    for intent, s in stats.items():
+        lines.append(f"{intent:<8} {s['count']:>6} {s['dropped']:>8} {s['timed_out']:>10} {s['mean_s']:>7.2f}s "
+                     f"{s['p95_s']:>7.2f}s {s['max_s']:>7.2f}s")
+    if not stats:
+        lines.append("(no generations yet)")
+    return "\n".join(lines)
@@ -0,0 +1,177 @@
+"""Chunking and retrieval parameter sweep.
+
+Builds a throwaway Chroma index for every chunk size / overlap / separator
+combination, runs the labelled questions in data/eval/retrieval_questions.json
+against it and reports, for each k, the index size, chunk count, ingest time,
+average prompt size and recall@k (a question counts as recalled when any of
+its expected source files appears in the top k chunks).
+
+Chunk embeddings are cached on disk in .sweep_cache/, so chunks that are
+identical across configurations (and across runs) are only embedded once.
+With the cache warm, ingest_s measures splitting + indexing rather than
+embedding; pass --no-cache for cold numbers.
+"""
+import argparse
+import csv
+import json
+import tempfile
+import time
+from itertools import product
+from pathlib import Path
+
+from colorama import init, Fore
+from langchain.embeddings import CacheBackedEmbeddings
+from langchain.storage import LocalFileStore
+from langchain_community.embeddings import OllamaEmbeddings
+from langchain_community.vectorstores import Chroma
+
+from ask import build_prompt, detect_scope
+from ingest import CHUNK_OVERLAP, CHUNK_SIZE, SEPARATORS, load_documents, make_text_splitter
+from tokens import estimate_tokens
+
+init(autoreset=True)
+
+EMBEDDING_MODEL = "nomic-embed-text"
+
+SEPARATOR_SETS = {
+    "semantic": SEPARATORS,
+    "default": ["\n\n", "\n", " ", ""],
+}
+
+REPORT_FIELDS = [
+    "chunk_size", "chunk_overlap", "separators", "k",
+    "chunks", "index_bytes", "ingest_s", "avg_prompt_tokens", "recall",
+]
+
+
+def int_list(value):
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def dir_size(path):
+    return sum(f.stat().st_size for f in Path(path).rglob("*") if f.is_file())
+
+
+def source_name(doc):
+    return Path(doc.metadata.get("source", "")).name
+
+
+def run_config(docs, embeddings, query_vectors, questions, chunk_size, chunk_overlap, separators, ks):
+    """Index docs with one chunking setting and score every k against it."""
+    max_k = max(ks)
+
+    with tempfile.TemporaryDirectory(prefix="wema_sweep_", ignore_cleanup_errors=True) as tmp:
+        start = time.perf_counter()
+        chunks = make_text_splitter(chunk_size, chunk_overlap, SEPARATOR_SETS[separators]).split_documents(docs)
+        db = Chroma.from_documents(
+            documents=chunks,
+            embedding=embeddings,
+            persist_directory=tmp,
+            collection_name="wema_sweep"
+        )
+        db.persist()
+        ingest_s = time.perf_counter() - start
+        index_bytes = dir_size(tmp)
+
+        # Retrieve max_k once per question; smaller k values are prefixes
+        retrieved = []
+        for item, vector in zip(questions, query_vectors):
+            filter_meta = detect_scope(item["question"])
+            if filter_meta:
+                found = db.similarity_search_by_vector(vector, k=max_k, filter=filter_meta)
+            else:
+                found = db.similarity_search_by_vector(vector, k=max_k)
+            retrieved.append(found)
+
+        db.delete_collection()
+
+    rows = []
+    for k in ks:
+        hits = 0
+        prompt_tokens = 0
+        for item, found in zip(questions, retrieved):
+            top = found[:k]
+            if any(source_name(d) in item["sources"] for d in top):
+                hits += 1
+            prompt_tokens += estimate_tokens(build_prompt(item["question"], top))
+        rows.append({
+            "chunk_size": chunk_size,
+            "chunk_overlap": chunk_overlap,
+            "separators": separators,
+            "k": k,
+            "chunks": len(chunks),
+            "index_bytes": index_bytes,
+            "ingest_s": round(ingest_s, 2),
+            "avg_prompt_tokens": round(prompt_tokens / len(questions)),
+            "recall": round(hits / len(questions), 3),
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep chunking and retrieval settings")
+    parser.add_argument("--chunk-sizes", type=int_list, default=[400, CHUNK_SIZE, 1200])
+    parser.add_argument("--overlaps", type=int_list, default=[0, CHUNK_OVERLAP])
+    parser.add_argument("--separators", default="semantic,default",
+                        help=f"comma-separated separator sets: {', '.join(SEPARATOR_SETS)}")
+    parser.add_argument("--k", type=int_list, default=[2, 4, 5, 8])
+    parser.add_argument("--questions", default="data/eval/retrieval_questions.json")
+    parser.add_argument("--output", default="sweep_report.csv")
+    parser.add_argument("--cache-dir", default=".sweep_cache")
+    parser.add_argument("--no-cache", action="store_true", help="embed every chunk from scratch")
+    args = parser.parse_args()
+
+    separator_names = [s.strip() for s in args.separators.split(",") if s.strip()]
+    unknown = [s for s in separator_names if s not in SEPARATOR_SETS]
+    if unknown:
+        parser.error(f"unknown separator set(s): {', '.join(unknown)}")
+
+    questions = json.loads(Path(args.questions).read_text(encoding="utf-8"))
+
+    print(f"{Fore.CYAN}{'='*60}")
+    print(f"{Fore.CYAN}WEMA BANK AI ASSISTANT - CHUNKING SWEEP")
+    print(f"{Fore.CYAN}{'='*60}\n")
+
+    print(f"{Fore.YELLOW}📁 Loading documents...\n")
+    docs = load_documents()
+
+    base_embeddings = OllamaEmbeddings(model=EMBEDDING_MODEL)
+    if args.no_cache:
+        embeddings = base_embeddings
+    else:
+        embeddings = CacheBackedEmbeddings.from_bytes_store(
+            base_embeddings, LocalFileStore(args.cache_dir), namespace=EMBEDDING_MODEL
+        )
+
+    # Questions are the same for every configuration: embed them once
+    print(f"\n{Fore.YELLOW}🧠 Embedding {len(questions)} labelled questions...")
+    query_vectors = [base_embeddings.embed_query(item["question"]) for item in questions]
+
+    configs = [
+        (size, overlap, seps)
+        for size, overlap, seps in product(args.chunk_sizes, args.overlaps, separator_names)
+        if overlap < size
+    ]
+
+    rows = []
+    for i, (size, overlap, seps) in enumerate(configs, 1):
+        print(f"{Fore.YELLOW}[{i}/{len(configs)}] chunk_size={size} overlap={overlap} separators={seps}")
+        rows.extend(run_config(docs, embeddings, query_vectors, questions, size, overlap, seps, args.k))
+
+    with open(args.output, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    print(f"\n{Fore.CYAN}{'='*60}")
+    print(f"{Fore.CYAN}{'size':>6} {'ovl':>5} {'seps':>9} {'k':>3} {'chunks':>7} {'KB':>8} {'ingest':>8} {'tokens':>7} {'recall':>7}")
+    for r in rows:
+        print(f"{r['chunk_size']:>6} {r['chunk_overlap']:>5} {r['separators']:>9} {r['k']:>3} "
+              f"{r['chunks']:>7} {r['index_bytes'] / 1024:>8.1f} {r['ingest_s']:>7.2f}s "
+              f"{r['avg_prompt_tokens']:>7} {r['recall']:>7.3f}")
+    print(f"{Fore.CYAN}{'='*60}")
+    print(f"\n{Fore.GREEN}✓ Report written to {args.output}\n")
+
+
+if __name__ == "__main__":
+    main()
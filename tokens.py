@@ -0,0 +1,6 @@
+"""Prompt size estimates shared by sweep.py and scheduler.py."""
+
+
+def estimate_tokens(text):
+    """Rough token count for a prompt (~4 characters per token for English)."""
+    return max(1, len(text) // 4)
@@ -4,6 +4,8 @@ from langchain_chroma import Chroma  # Updated import
 import time
 from pathlib import Path
 import sys
+from scheduler import GenerationScheduler, format_stats
+from demo_questions import DEMO_CATEGORIES
 
 SYSTEM_PROMPT = """
 You are a commercial Bank Internal AI Assistant.
@@ -43,6 +45,12 @@ def initialize_system():
 
 llm, retriever, db = initialize_system()
 
+# Orders concurrent generations: quick lookups before long drafts, with caps
+scheduler = GenerationScheduler(llm) if llm else None
+
+# Requests handled at once by the ask event; generation is still queued by the scheduler
+ASK_CONCURRENCY = 16
+
 def detect_scope(query: str):
     q = query.lower()
     if any(w in q for w in ["policy", "procedure", "guideline"]):
@@ -53,11 +61,16 @@ def detect_scope(query: str):
         return {"type": "memo"}
     return None
 
+def add_turn(history, question, answer):
+    # gr.Chatbot (Gradio 6) only accepts the messages format
+    history.append({"role": "user", "content": question})
+    history.append({"role": "assistant", "content": answer})
+
 def ask_question(question, history):
     """Process question and return response"""
     
     if not llm:
-        history.append((question, "System not initialized. Please run 'python ingest.py' and ensure Ollama is running."))
+        add_turn(history, question, "System not initialized. Please run 'python ingest.py' and ensure Ollama is running.")
         return history, ""
 
     if not question.strip():
@@ -90,55 +103,20 @@ Answer:
     # Get response with timing
     start_time = time.time()
     try:
-        response = llm.invoke(prompt)
+        response, queued = scheduler.generate(prompt, question)
         elapsed = time.time() - start_time
         
         # Format response with metadata
-        formatted_response = f"{response}\n\n*⏱️ Response time: {elapsed:.2f}s | 🧠 Local GPU Processing*"
+        formatted_response = f"{response}\n\n*⏱️ Response time: {elapsed:.2f}s (queued {queued:.2f}s) | 🧠 Local GPU Processing*"
         
         # Update history
-        history.append((question, formatted_response))
+        add_turn(history, question, formatted_response)
     except Exception as e:
-        history.append((question, f"Error: {e}"))
+        add_turn(history, question, f"Error: {e}")
     
     return history, ""
 
 
-# Demo questions organized by category
-DEMO_CATEGORIES = {
-    "📋 Policy Questions": [
-        "What collateral is required for SME overdraft?",
-        "What is the turnaround time for loan approval?",
-        "What documents are needed for SME loan application?",
-        "What are the interest rates for term loans?",
-        "How do I reactivate a dormant account?"
-    ],
-    "👤 Customer Service": [
-        "What is John Bello's complaint about?",
-        "How many customer complaints are pending?",
-        "What should we do about Fatima Ibrahim's ATM card issue?",
-        "Draft a response to Chidi Okafor about his loan application delay"
-    ],
-    "💳 Transactions": [
-        "Show me account 0123456789's transaction summary for January",
-        "What was the highest expense in January for account 0123456789?",
-        "How much interest was earned in January?",
-        "Why did transaction TXN20260205005 fail?"
-    ],
-    "⚖️ Compliance & Regulations": [
-        "What are the CBN requirements for foreign exchange transactions?",
-        "What is the maximum Personal Travel Allowance?",
-        "What are the KYC requirements for account opening?",
-        "What transactions must be reported to NFIU?"
-    ],
-    "🏢 Operations": [
-        "What is the branch manager's approval limit for overdrafts?",
-        "What should I do during system downtime?",
-        "What are the month-end procedures?",
-        "When is the internal audit scheduled?"
-    ]
-}
-
 # Flatten all demo questions
 ALL_DEMO_QUESTIONS = []
 for category, questions in DEMO_CATEGORIES.items():
@@ -214,13 +192,17 @@ with gr.Blocks(
     submit_btn.click(
         ask_question,
         inputs=[question_input, chatbot],
-        outputs=[chatbot, question_input]
+        outputs=[chatbot, question_input],
+        api_name="ask",  # Stable endpoint name for loadtest.py
+        concurrency_limit=ASK_CONCURRENCY
     )
     
     question_input.submit(
         ask_question,
         inputs=[question_input, chatbot],
-        outputs=[chatbot, question_input]
+        outputs=[chatbot, question_input],
+        api_name=False,
+        concurrency_limit=ASK_CONCURRENCY
     )
     
     clear_btn.click(lambda: [], outputs=chatbot)
@@ -250,4 +232,8 @@ if __name__ == "__main__":
         share=False,
         show_error=True,
         theme=gr.themes.Soft(primary_hue="purple")  # Moved theme here
-    )
\ No newline at end of file
+    )
+
+    if scheduler:
+        print("\nQueue time by intent:")
+        print(format_stats(scheduler.stats()))